@@ -32,8 +32,14 @@ class PatternCorrelation:
         # Sort by timestamp (Splunk format is ISO-like)
         sorted_events = sorted(events, key=lambda x: x.get("_time", x.get("timestamp", "")))
         
+        # Parse each timestamp once up front rather than once per pair
+        event_times = [
+            self._parse_timestamp(event.get("_time", event.get("timestamp")))
+            for event in sorted_events
+        ]
+        
         for i, event in enumerate(sorted_events):
-            event_time = self._parse_timestamp(event.get("_time", event.get("timestamp")))
+            event_time = event_times[i]
             if not event_time:
                 continue
             
@@ -42,7 +48,7 @@ class PatternCorrelation:
                 if i == j:
                     continue
                 
-                other_time = self._parse_timestamp(other_event.get("_time", other_event.get("timestamp")))
+                other_time = event_times[j]
                 if not other_time:
                     continue
                 
@@ -323,11 +323,7 @@ class RCAEngine:
     
     def _index_to_service(self, index: str) -> str:
         """Map Splunk index to service name using catalog."""
-        for service_id, service_data in self.service_catalog.services.items():
-            indexes = self.service_catalog.get_splunk_indexes(service_id)
-            if index.lower() in [idx.lower() for idx in indexes]:
-                return service_id
-        return index
+        return self.service_catalog.find_service_by_index(index) or index
     
     def _categorize_error(self, item: Dict[str, Any]) -> str:
         """Categorize error from finding or result (consolidated)."""
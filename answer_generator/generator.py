@@ -22,6 +22,10 @@ class AnswerGenerator:
         )
         logger.info("Initialized Bedrock answer generator", model=self.config.llm_model)
     
+    async def aclose(self):
+        """Release the Bedrock client's connections."""
+        await self.bedrock_client.aclose()
+    
     async def generate_answer(
         self,
         question: str,
@@ -9,6 +9,7 @@ from gateway.config import GatewayConfig
 from gateway.models import QueryRequest, QueryResponse
 from orchestrator.orchestrator import InvestigationOrchestrator
 from shared.logger import setup_logging
+from splunk_integration.client import SplunkClient
 
 config = GatewayConfig()
 logger = setup_logging()
@@ -48,6 +49,8 @@ async def shutdown_event():
             await memory.vector_store.close()
     except Exception as e:
         logger.warning("Error closing database connections", error=str(e))
+    # Stop the Splunk REST worker threads
+    SplunkClient.shutdown_executor()
 
 @app.get("/health")
 async def health_check():
@@ -62,11 +65,14 @@ async def query(request: QueryRequest):
     
     try:
         orchestrator = InvestigationOrchestrator()
-        result = await orchestrator.investigate(
-            question=request.question,
-            time_window=request.time_window,
-            context=request.context
-        )
+        try:
+            result = await orchestrator.investigate(
+                question=request.question,
+                time_window=request.time_window,
+                context=request.context
+            )
+        finally:
+            await orchestrator.aclose()
         
         processing_time = (time.time() - start_time) * 1000
         
@@ -2,11 +2,12 @@
 from typing import List
 import structlog
 import os
-import json
 import asyncio
 import boto3
 from botocore.exceptions import ClientError
 
+from shared import jsonlib
+
 logger = structlog.get_logger()
 
 class EmbeddingService:
@@ -78,11 +79,11 @@ class EmbeddingService:
             None,
             lambda: self.client.invoke_model(
                 modelId=self.model_id,
-                body=json.dumps(body)
+                body=jsonlib.dumps(body)
             )
         )
         
-        response_body = json.loads(response['body'].read())
+        response_body = jsonlib.loads(response['body'].read())
         embedding = response_body['embedding']
         
         return embedding
@@ -1,6 +1,7 @@
 """Main orchestration logic for bug investigation with multi-hop tracing."""
 from typing import Dict, Any, Optional, List, Set
 from datetime import datetime
+import asyncio
 import structlog
 
 from orchestrator.planning import PlanningEngine
@@ -32,6 +33,14 @@ class InvestigationOrchestrator:
         self.rca_engine = RCAEngine(self.service_catalog)
         self.correlation_engine = PatternCorrelation()
     
+    async def aclose(self):
+        """Release the Bedrock clients held by the planning, query and answer stages."""
+        await asyncio.gather(
+            self.planning_engine.aclose(),
+            self.query_generator.aclose(),
+            self.answer_generator.aclose()
+        )
+    
     async def investigate(
         self,
         question: str,
@@ -26,30 +26,16 @@ class PlanningEngine:
         self.service_catalog = ServiceCatalog()
         logger.info("Initialized Bedrock planning engine")
     
+    async def aclose(self):
+        """Release the Bedrock client's connections."""
+        await self.bedrock_client.aclose()
+    
     async def extract_intent(self, question: str) -> Dict[str, Any]:
         """Extract intent and key information from the question using Bedrock.
         Service catalog aware - only extracts entities that match known services."""
         
-        # Get available services and their information from catalog
-        available_services = {}
-        for service_id, service_data in self.service_catalog.services.items():
-            indexes = self.service_catalog.get_splunk_indexes(service_id)
-            available_services[service_id] = {
-                "service_id": service_id,
-                "domain": service_data.get("domain"),
-                "tier": service_data.get("tier"),
-                "splunk_indexes": indexes
-            }
-        
-        # Build service catalog context for the LLM
-        service_catalog_context = "Available Services in Catalog:\n"
-        for service_id, info in available_services.items():
-            service_catalog_context += f"- {service_id}"
-            if info.get("domain"):
-                service_catalog_context += f" (domain: {info['domain']}, tier: {info['tier']})"
-            if info.get("splunk_indexes"):
-                service_catalog_context += f" - Splunk indexes: {', '.join(info['splunk_indexes'])}"
-            service_catalog_context += "\n"
+        # Service catalog context for the LLM (immutable, rendered once by the catalog)
+        service_catalog_context = self.service_catalog.as_prompt_block()
         
         system_prompt = """You are an expert at analyzing technical questions and extracting key information.
 Extract entities, time references, and symptom keywords from the question.
@@ -118,19 +104,14 @@ Provide your response as a JSON object with keys: entities, time_references, sym
                                matched_service=matched_service.get("service_id"))
                 else:
                     # If not a service, check if it's a valid Splunk index from the catalog
-                    index_matched = False
-                    for service_id, service_data in self.service_catalog.services.items():
-                        indexes = self.service_catalog.get_splunk_indexes(service_id)
-                        if entity.lower() in [idx.lower() for idx in indexes]:
-                            # Index matches - use the service that owns this index
-                            validated_entities.append(service_id)
-                            logger.debug("Validated entity as index, mapped to service",
-                                       extracted_index=entity,
-                                       matched_service=service_id)
-                            index_matched = True
-                            break
-                    
-                    if not index_matched:
+                    service_id = self.service_catalog.find_service_by_index(entity)
+                    if service_id is not None:
+                        # Index matches - use the service that owns this index
+                        validated_entities.append(service_id)
+                        logger.debug("Validated entity as index, mapped to service",
+                                   extracted_index=entity,
+                                   matched_service=service_id)
+                    else:
                         logger.warning("Entity not found in service catalog (not a service or valid index), ignoring", entity=entity)
             
             # Extract query patterns (like "origin", "first occurrence", etc.)
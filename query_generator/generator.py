@@ -13,12 +13,18 @@ logger = structlog.get_logger()
 class SplunkQueryGenerator:
     """Splunk query generator with LLM and guardrails."""
     
+    __slots__ = ("config", "guardrails", "llm_client", "splunk_client")
+    
     def __init__(self):
         self.config = QueryGeneratorConfig()
         self.guardrails = QueryGuardrails()
         self.llm_client = LLMClient(self.config)
         self.splunk_client = SplunkClient()
     
+    async def aclose(self):
+        """Release the LLM client's connections."""
+        await self.llm_client.aclose()
+    
     async def generate_query(
         self,
         hypothesis: str,
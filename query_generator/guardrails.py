@@ -1,5 +1,6 @@
 """Guardrails for validating and constraining SPL queries."""
 from typing import List, Dict
+from datetime import timedelta
 import re
 import structlog
 
@@ -10,24 +11,32 @@ logger = structlog.get_logger()
 class QueryGuardrails:
     """Guardrails for validating and constraining SPL queries."""
     
-    DANGEROUS_COMMANDS = ['delete', 'eval.*delete', 'outputlookup.*append']
+    __slots__ = ()
+    
+    # 'eval.*delete' is already covered by 'delete'
+    DANGEROUS_COMMANDS = ['delete', 'outputlookup.*append']
     MAX_TIME_RANGE_DAYS = 30
     
+    # One capture group per dangerous command so the matching entry can be reported
+    _DANGEROUS_RE = re.compile(
+        "|".join(f"({pattern})" for pattern in DANGEROUS_COMMANDS), re.IGNORECASE
+    )
+    _SPL_STRUCTURE_RE = re.compile(r"index=|search|\|", re.IGNORECASE)
+    
     def validate_query(self, query: str) -> bool:
         """Validate that the query is safe to execute."""
-        query_lower = query.lower()
-        
         # Check for dangerous commands
-        for dangerous in self.DANGEROUS_COMMANDS:
-            if re.search(dangerous, query_lower):
-                raise ValidationError(f"Query contains dangerous command: {dangerous}")
+        match = self._DANGEROUS_RE.search(query)
+        if match:
+            dangerous = self.DANGEROUS_COMMANDS[match.lastindex - 1]
+            raise ValidationError(f"Query contains dangerous command: {dangerous}")
         
         # Check query length
         if len(query) > 10000:
             raise ValidationError("Query exceeds maximum length")
         
         # Check for basic SPL structure
-        if not any(keyword in query_lower for keyword in ['index=', 'search', '|']):
+        if not self._SPL_STRUCTURE_RE.search(query):
             logger.warning("Query may not be valid SPL", query=query)
         
         return True
@@ -40,7 +49,6 @@ class QueryGuardrails:
                    'earliest' and 'latest' as Unix epoch timestamps for Splunk API kwargs
         """
         # Ensure time window is within limits
-        from datetime import datetime, timedelta
         start, end = time_window
         days_diff = (end - start).days
         
@@ -52,14 +60,6 @@ class QueryGuardrails:
         earliest_timestamp = int(start.timestamp())
         latest_timestamp = int(end.timestamp())
         
-        # Remove any existing earliest/latest from query string (they'll be passed as kwargs)
-        # Clean the query to remove time constraints that might have been added
-        # query_cleaned = query
-        # # Remove earliest= and latest= patterns from query
-        # query_cleaned = re.sub(r'earliest\s*=\s*[^\s"]+\s*', '', query_cleaned, flags=re.IGNORECASE)
-        # query_cleaned = re.sub(r'latest\s*=\s*[^\s"]+\s*', '', query_cleaned, flags=re.IGNORECASE)
-        # query_cleaned = re.sub(r'\s+', ' ', query_cleaned).strip()  # Clean up extra spaces
-        
         time_params = {
             'earliest_time': earliest_timestamp,
             'latest_time': latest_timestamp
@@ -2,6 +2,7 @@
 from typing import Optional, Dict, Any
 import structlog
 import os
+import re
 
 from query_generator.config import QueryGeneratorConfig
 from shared.bedrock_client import BedrockClient
@@ -9,6 +10,9 @@ from shared.service_catalog import ServiceCatalog
 
 logger = structlog.get_logger()
 
+# Markdown code fences (```spl / ```sql / ```) and stray backticks around LLM output
+_FENCE_RE = re.compile(r"```(?:spl|sql)?|`", re.IGNORECASE)
+
 class LLMClient:
     """LLM client for generating SPL queries using Amazon Bedrock."""
     
@@ -21,10 +25,25 @@ class LLMClient:
             aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
             model_id=config.llm_model
         )
+        # System prompt is invariant per client, so build it once
+        self._system_prompt = """You are a Splunk Query Language (SPL) expert. Your task is to generate valid SPL queries based on investigation hypotheses.
+
+Guidelines:
+- Generate only valid SPL queries
+- Do not include explanations, markdown formatting, or code blocks
+- Use appropriate SPL commands and syntax
+- Include time constraints when relevant
+- Focus on the specific hypothesis provided
+- Use the extracted entities and keywords to make queries more precise
+- If the user asks for "origin" or "first occurrence", use '| sort _time' followed by '| head 1' to get the earliest result"""
         # Initialize service catalog for index-aware query generation
         self.service_catalog = ServiceCatalog()
         logger.info("Initialized Bedrock LLM client", provider=config.llm_provider, model=config.llm_model)
     
+    async def aclose(self):
+        """Release the Bedrock client's connections."""
+        await self.bedrock_client.aclose()
+    
     async def generate_spl_query(
         self,
         hypothesis: str,
@@ -33,17 +52,6 @@ class LLMClient:
         intent: Optional[Dict[str, Any]] = None
     ) -> str:
         """Generate SPL query using Amazon Bedrock."""
-        system_prompt = """You are a Splunk Query Language (SPL) expert. Your task is to generate valid SPL queries based on investigation hypotheses.
-
-Guidelines:
-- Generate only valid SPL queries
-- Do not include explanations, markdown formatting, or code blocks
-- Use appropriate SPL commands and syntax
-- Include time constraints when relevant
-- Focus on the specific hypothesis provided
-- Use the extracted entities and keywords to make queries more precise
-- If the user asks for "origin" or "first occurrence", use '| sort _time' followed by '| head 1' to get the earliest result"""
-
         # Build historical context section
         historical_section = ""
         if historical_examples:
@@ -57,30 +65,32 @@ Guidelines:
             symptom_keywords = intent.get("symptom_keywords", [])
             query_patterns = intent.get("query_patterns", [])
             if entities or symptom_keywords or query_patterns:
-                intent_section = "\nExtracted Information:\n"
+                intent_parts = ["\nExtracted Information:\n"]
                 if entities:
-                    intent_section += f"Key Entities to search for: {', '.join(entities)}\n"
+                    intent_parts.append(f"Key Entities to search for: {', '.join(entities)}\n")
                 if symptom_keywords:
-                    intent_section += f"Keywords/Patterns to match: {', '.join(symptom_keywords)}\n"
+                    intent_parts.append(f"Keywords/Patterns to match: {', '.join(symptom_keywords)}\n")
                 if query_patterns:
                     if "origin" in query_patterns or "first_occurrence" in query_patterns:
-                        intent_section += "IMPORTANT: User wants to find the FIRST/EARLIEST occurrence. Use '| sort _time' followed by '| head 1' to get the earliest result.\n"
-                intent_section += "Use these entities and keywords in your SPL query to make it more targeted.\n"
+                        intent_parts.append("IMPORTANT: User wants to find the FIRST/EARLIEST occurrence. Use '| sort _time' followed by '| head 1' to get the earliest result.\n")
+                intent_parts.append("Use these entities and keywords in your SPL query to make it more targeted.\n")
+                intent_section = "".join(intent_parts)
                 
                 # Get Splunk indexes for matched services
                 matched_services = self.service_catalog.find_services_by_entities(entities)
                 if matched_services:
-                    index_context = "\nSplunk Index Information:\n"
+                    index_parts = ["\nSplunk Index Information:\n"]
                     for service in matched_services:
                         service_id = service.get("service_id")
                         indexes = self.service_catalog.get_splunk_indexes(service_id)
                         if indexes:
-                            index_context += f"- Service '{service_id}' uses indexes: {', '.join(indexes)}\n"
-                            index_context += f"  Use 'index={indexes[0]}' or 'index={' OR index='.join(indexes)}' in your SPL query for this service.\n"
+                            index_parts.append(f"- Service '{service_id}' uses indexes: {', '.join(indexes)}\n")
+                            index_parts.append(f"  Use 'index={indexes[0]}' or 'index={' OR index='.join(indexes)}' in your SPL query for this service.\n")
                     
-                    if not index_context.endswith("\n\n"):
-                        index_context += "\n"
-                    index_context += "IMPORTANT: Use the correct Splunk indexes from the service catalog above. Do not guess or hallucinate index names.\n"
+                    # Every line above ends with a single newline, so add the blank separator line
+                    index_parts.append("\n")
+                    index_parts.append("IMPORTANT: Use the correct Splunk indexes from the service catalog above. Do not guess or hallucinate index names.\n")
+                    index_context = "".join(index_parts)
         
         user_prompt = f"""Generate a Splunk Query Language (SPL) query to investigate the following hypothesis.
 
@@ -93,22 +103,14 @@ Use the correct Splunk indexes from the service catalog information provided abo
         try:
             response = await self.bedrock_client.invoke(
                 prompt=user_prompt,
-                system_prompt=system_prompt,
+                system_prompt=self._system_prompt,
                 temperature=self.config.llm_temperature,
                 max_tokens=500
             )
             
-            # Clean up the response - remove markdown code blocks if present
-            query = response.strip()
-            # Remove markdown code blocks
-            query = query.replace("```spl", "").replace("```", "").strip()
-            # Remove any backticks that might wrap the entire query (common LLM mistake)
-            if query.startswith("`") and query.endswith("`"):
-                query = query[1:-1].strip()
-            # Remove any leading/trailing quotes
-            query = query.strip('"').strip("'")
-            # Remove any remaining backticks (they shouldn't be in SPL queries)
-            query = query.replace("`", "")
+            # Clean up the response - remove markdown code blocks and backticks in one pass
+            # (backticks shouldn't be in SPL queries), then any leading/trailing quotes
+            query = _FENCE_RE.sub("", response).strip().strip("\"'")
             
             logger.info("Generated SPL query using Bedrock", query=query[:100])
             return query
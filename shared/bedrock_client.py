@@ -1,13 +1,18 @@
 """Amazon Bedrock client for LLM operations."""
-import boto3
-import json
 import asyncio
+import json
+from contextlib import AsyncExitStack
 from typing import Optional, Dict, Any, List
 import structlog
+from aiobotocore.session import get_session
 from botocore.exceptions import ClientError
 
+from shared import jsonlib
+
 logger = structlog.get_logger()
 
+ANTHROPIC_VERSION = "bedrock-2023-05-31"
+
 class BedrockClient:
     """Amazon Bedrock client for LLM operations."""
     
@@ -34,17 +39,64 @@ class BedrockClient:
         self.region_name = region_name
         self.model_id = self.MODELS.get(model_id, model_id)  # Use provided or lookup
         
-        # Initialize boto3 client
-        client_kwargs = {"service_name": "bedrock-runtime", "region_name": region_name}
+        # Store aiobotocore session; the runtime client is created on first use and
+        # reused (with its connection pool) until aclose()
+        self._client_kwargs = {"service_name": "bedrock-runtime", "region_name": region_name}
         if aws_access_key_id and aws_secret_access_key:
-            client_kwargs.update({
+            self._client_kwargs.update({
                 "aws_access_key_id": aws_access_key_id,
                 "aws_secret_access_key": aws_secret_access_key
             })
         
-        self.client = boto3.client(**client_kwargs)
+        self._session = get_session()
+        self._runtime = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._runtime_lock = asyncio.Lock()
+        # Compact JSON encoder and cache of pre-serialized static body prefixes
+        self._encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+        self._static_body_prefixes: Dict[Optional[str], str] = {}
         logger.info("Initialized Bedrock client", region=region_name, model=model_id)
     
+    async def _client(self):
+        """Get the async bedrock-runtime client, creating it on first use."""
+        if self._runtime is None:
+            async with self._runtime_lock:
+                if self._runtime is None:
+                    stack = AsyncExitStack()
+                    self._runtime = await stack.enter_async_context(
+                        self._session.create_client(**self._client_kwargs)
+                    )
+                    self._exit_stack = stack
+        return self._runtime
+    
+    async def aclose(self):
+        """Close the bedrock-runtime client and its connection pool."""
+        if self._exit_stack is not None:
+            stack = self._exit_stack
+            self._exit_stack = None
+            self._runtime = None
+            await stack.aclose()
+    
+    def _static_body_prefix(self, system_prompt: Optional[str]) -> str:
+        """Get the serialized Anthropic body prefix (version + system prompt) without its closing brace."""
+        prefix = self._static_body_prefixes.get(system_prompt)
+        if prefix is None:
+            static = {"anthropic_version": ANTHROPIC_VERSION}
+            if system_prompt:
+                static["system"] = system_prompt
+            prefix = self._encoder(static)[:-1]
+            self._static_body_prefixes[system_prompt] = prefix
+        return prefix
+    
+    async def _invoke_model(self, body: str) -> Dict[str, Any]:
+        """Invoke the configured model with a serialized body and return the decoded response body."""
+        c = await self._client()
+        response = await c.invoke_model(
+            modelId=self.model_id,
+            body=body
+        )
+        return jsonlib.loads(await response['body'].read())
+    
     async def invoke(
         self,
         prompt: str,
@@ -105,30 +157,18 @@ class BedrockClient:
         messages = [{"role": "user", "content": prompt}]
         
         body = {
-            "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": max_tokens,
             "temperature": temperature,
             "messages": messages
         }
         
-        # Add system prompt if provided (Claude 3 supports system prompts)
-        if system_prompt:
-            body["system"] = system_prompt
-        
         if stop_sequences:
             body["stop_sequences"] = stop_sequences
         
-        # Run synchronous boto3 call in executor
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(body)
-            )
-        )
-        
-        response_body = json.loads(response['body'].read())
+        # anthropic_version and system prompt (Claude 3 supports system prompts) are
+        # serialized once per system prompt and spliced in front of the dynamic fields
+        serialized = self._static_body_prefix(system_prompt) + "," + self._encoder(body)[1:]
+        response_body = await self._invoke_model(serialized)
         return response_body['content'][0]['text']
     
     async def _invoke_llama(
@@ -144,17 +184,7 @@ class BedrockClient:
             "temperature": temperature
         }
         
-        # Run synchronous boto3 call in executor
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(body)
-            )
-        )
-        
-        response_body = json.loads(response['body'].read())
+        response_body = await self._invoke_model(self._encoder(body))
         return response_body['generation']
     
     async def _invoke_titan(
@@ -172,17 +202,7 @@ class BedrockClient:
             }
         }
         
-        # Run synchronous boto3 call in executor
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.client.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(body)
-            )
-        )
-        
-        response_body = json.loads(response['body'].read())
+        response_body = await self._invoke_model(self._encoder(body))
         return response_body['results'][0]['outputText']
     
     async def chat_completion(
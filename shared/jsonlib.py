@@ -0,0 +1,36 @@
+"""JSON encode/decode helpers backed by the fastest installed library.
+
+Prefers orjson, then ujson, then the standard library. ``loads`` accepts
+str or bytes; ``dumps`` always returns compact UTF-8 bytes.
+"""
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return orjson.dumps(obj, default=default)
+elif ujson is not None:
+    loads = ujson.loads
+
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False, default=default).encode("utf-8")
+else:
+    loads = json.loads
+
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=default).encode("utf-8")
@@ -1,8 +1,67 @@
 """Structured logging setup."""
 import structlog
+import atexit
 import logging
+import queue
 import sys
-from typing import Any
+import threading
+from typing import Any, List, Optional
+
+from shared import jsonlib
+
+class _QueuedLogWriter:
+    """File-like bytes sink that moves log writes off the calling thread.
+    
+    write() only enqueues; a daemon thread drains everything pending and does
+    a single write + flush per batch. Remaining logs are flushed at exit.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain_loop, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def write(self, data: bytes) -> None:
+        self._queue.put(data)
+    
+    def flush(self) -> None:
+        # Flushing happens once per batch in the writer thread
+        pass
+    
+    def _drain_loop(self):
+        while True:
+            data = self._queue.get()
+            if data is None:
+                return
+            chunks: List[bytes] = [data]
+            while True:
+                try:
+                    data = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if data is None:
+                    self._write(chunks)
+                    return
+                chunks.append(data)
+            self._write(chunks)
+    
+    def _write(self, chunks: List[bytes]):
+        try:
+            self._stream.write(b"".join(chunks))
+            self._stream.flush()
+        except (OSError, ValueError):
+            # Stream closed or broken; nothing sensible left to log to
+            pass
+    
+    def close(self):
+        """Flush pending logs and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+_log_writer: Optional[_QueuedLogWriter] = None
 
 def setup_logging(level: str = "INFO") -> structlog.BoundLogger:
     """Setup structured logging for the application."""
@@ -16,18 +75,27 @@ def setup_logging(level: str = "INFO") -> structlog.BoundLogger:
     }
     log_level = level_map.get(level.upper(), logging.INFO)
     
+    processors = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+    ]
+    # Stack info rendering is only useful when debugging
+    if log_level == logging.DEBUG:
+        processors.append(structlog.processors.StackInfoRenderer())
+    processors.append(structlog.dev.set_exc_info)
+    
+    # jsonlib renders straight to bytes, written without a str round-trip
+    global _log_writer
+    if _log_writer is None:
+        _log_writer = _QueuedLogWriter(sys.stdout.buffer)
+    processors.append(structlog.processors.JSONRenderer(serializer=jsonlib.dumps))
+    logger_factory = structlog.BytesLoggerFactory(file=_log_writer)
+    
     structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.processors.JSONRenderer()
-        ],
+        processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=False,
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
     )
     return structlog.get_logger()
-
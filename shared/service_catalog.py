@@ -1,82 +1,194 @@
 """Service catalog for understanding service relationships and observability."""
-import json
 import os
-from typing import Dict, Any, List, Optional, Set
+import sys
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 import structlog
 
+from shared import jsonlib
+
 logger = structlog.get_logger()
 
 class ServiceCatalog:
     """Service catalog for understanding service relationships and observability."""
     
     def __init__(self, catalog_path: Optional[str] = None):
-        """Initialize service catalog from JSON file."""
+        """Initialize service catalog; the JSON file is loaded on first access."""
         if catalog_path is None:
             # Default to service-catalog.json in the same directory
             current_dir = Path(__file__).parent
             catalog_path = current_dir / "service-catalog.json"
         
         self.catalog_path = catalog_path
-        self.catalog_data: Dict[str, Any] = {}
-        self.services: Dict[str, Dict[str, Any]] = {}
-        self._load_catalog()
+        self._catalog_data: Dict[str, Any] = {}
+        self._services: Dict[str, Dict[str, Any]] = {}
+        # Lookup indexes built once per load (see _build_indexes)
+        self._lower_to_id: Dict[str, str] = {}
+        self._lower_ids: List[Tuple[str, str]] = []
+        self._indexes: Dict[str, List[str]] = {}
+        self._index_to_service: Dict[str, str] = {}
+        self._upstream_ids: Dict[str, List[str]] = {}
+        self._downstream: Dict[str, List[str]] = {}
+        self._prompt_block: str = ""
+        # Memoized dependency chains; the catalog is immutable once loaded
+        self._chain_cache: Dict[Tuple[str, str], List[str]] = {}
+        self._loaded = False
+        self._load_lock = threading.Lock()
+    
+    def _ensure_loaded(self):
+        """Load the catalog once, on first access (safe across executor threads)."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load_catalog()
+                self._loaded = True
+    
+    @property
+    def catalog_data(self) -> Dict[str, Any]:
+        """Raw catalog JSON document."""
+        self._ensure_loaded()
+        return self._catalog_data
+    
+    @property
+    def services(self) -> Dict[str, Dict[str, Any]]:
+        """Services keyed by service id."""
+        self._ensure_loaded()
+        return self._services
     
     def _load_catalog(self):
         """Load service catalog from JSON file."""
         try:
-            with open(self.catalog_path, 'r') as f:
-                self.catalog_data = json.load(f)
-                self.services = self.catalog_data.get("services", {})
-                logger.info("Loaded service catalog", services_count=len(self.services))
+            self._catalog_data = jsonlib.loads(Path(self.catalog_path).read_bytes())
+            # Intern service ids so the many id lists/maps built from them share one
+            # string object per service and equality checks short-circuit on identity
+            self._services = {sys.intern(k): v for k, v in self._catalog_data.get("services", {}).items()}
+            self._catalog_data["services"] = self._services
+            logger.info("Loaded service catalog", services_count=len(self._services))
         except FileNotFoundError:
             logger.warning("Service catalog file not found", path=self.catalog_path)
-            self.services = {}
-        except json.JSONDecodeError as e:
+            self._services = {}
+        except ValueError as e:  # decode errors from orjson, ujson and json all subclass it
             logger.error("Failed to parse service catalog JSON", error=str(e))
-            self.services = {}
+            self._services = {}
+        self._build_indexes()
     
-    def find_service(self, service_name: str) -> Optional[Dict[str, Any]]:
-        """Find a service by name (case-insensitive, partial match)."""
-        service_name_lower = service_name.lower()
-        
-        # Exact match
-        if service_name in self.services:
-            return self.services[service_name]
+    def _build_indexes(self):
+        """Build name and Splunk index lookups in a single pass over the catalog."""
+        self._lower_to_id = {}
+        self._lower_ids = []
+        self._indexes = {}
+        self._index_to_service = {}
+        self._upstream_ids = {}
+        self._downstream = {}
+        self._chain_cache = {}
+        for service_id in self._services:
+            service_data = self._services[service_id]
+            service_id_lower = service_id.lower()
+            # First service in catalog order wins, as with the original linear scans
+            self._lower_to_id.setdefault(service_id_lower, service_id)
+            self._lower_ids.append((service_id_lower, service_id))
+            observability = service_data.get("observability", {})
+            splunk = observability.get("splunk", {})
+            self._indexes[service_id] = splunk.get("primary_indexes", [])
+            for index in self._indexes[service_id]:
+                # First service in catalog order owns an index shared by several
+                self._index_to_service.setdefault(index.lower(), service_id)
+            # Upstream service names (dict-or-str entries normalized) and the reverse
+            # adjacency: each upstream dependency gains this service as downstream
+            upstream_ids = []
+            for dep in service_data.get("dependencies", {}).get("upstream", []):
+                dep_service = dep.get("service") if isinstance(dep, dict) else dep
+                if isinstance(dep_service, str):
+                    dep_service = sys.intern(dep_service)
+                self._downstream.setdefault(dep_service, []).append(service_id)
+                if dep_service:
+                    upstream_ids.append(dep_service)
+            self._upstream_ids[service_id] = upstream_ids
+        self._prompt_block = self._build_prompt_block()
+    
+    def _build_prompt_block(self) -> str:
+        """Render the catalog summary used in LLM prompts."""
+        indexes = self._indexes
+        lines = [
+            f"- {service_id}"
+            + (f" (domain: {domain}, tier: {service_data.get('tier')})" if (domain := service_data.get("domain")) else "")
+            + (f" - Splunk indexes: {', '.join(indexes[service_id])}" if indexes[service_id] else "")
+            + "\n"
+            for service_id, service_data in self._services.items()
+        ]
+        return "Available Services in Catalog:\n" + "".join(lines)
+    
+    def as_prompt_block(self) -> str:
+        """Get the catalog summary for LLM prompts (built once at load time)."""
+        self._ensure_loaded()
+        return self._prompt_block
+    
+    def _partial_match(self, service_name_lower: str) -> Optional[str]:
+        """Find the first service whose id contains, or is contained in, the search term."""
+        for service_id_lower, service_id in self._lower_ids:
+            if service_name_lower in service_id_lower or service_id_lower in service_name_lower:
+                return service_id
+        return None
+    
+    def _resolve_service_id(self, service_name: str) -> Optional[str]:
+        """Resolve a service name to its catalog key (case-insensitive, partial match)."""
+        # Exact match (the common case: callers pass canonical ids) needs no lowercasing
+        if service_name in self._services:
+            return service_name
         
         # Case-insensitive match
-        for service_id, service_data in self.services.items():
-            if service_id.lower() == service_name_lower:
-                return service_data
-        
-        # Partial match (service name contains the search term)
-        for service_id, service_data in self.services.items():
-            if service_name_lower in service_id.lower() or service_id.lower() in service_name_lower:
-                return service_data
+        service_name_lower = service_name.lower()
+        service_id = self._lower_to_id.get(service_name_lower)
+        if service_id is not None:
+            return service_id
         
-        return None
+        # Partial match (service name contains the search term or vice versa)
+        return self._partial_match(service_name_lower)
+    
+    def find_service(self, service_name: str) -> Optional[Dict[str, Any]]:
+        """Find a service by name (case-insensitive, partial match)."""
+        self._ensure_loaded()
+        service = self._services.get(service_name)
+        if service is not None:
+            return service
+        service_id = self._resolve_service_id(service_name)
+        if service_id is None:
+            return None
+        return self._services[service_id]
     
     def find_services_by_entities(self, entities: List[str]) -> List[Dict[str, Any]]:
-        """Find services matching a list of entity names."""
-        matched_services = []
+        """Find services matching a list of entity names (each service returned once)."""
+        self._ensure_loaded()
+        matched_ids: Dict[str, None] = {}
         for entity in entities:
-            service = self.find_service(entity)
-            if service:
-                matched_services.append(service)
-        return matched_services
+            service_id = self._resolve_service_id(entity)
+            if service_id is not None:
+                matched_ids[service_id] = None
+        return [self._services[sid] for sid in matched_ids]
     
     def get_splunk_indexes(self, service_id: str) -> List[str]:
         """Get Splunk primary indexes for a service."""
-        service = self.find_service(service_id)
-        if not service:
-            return []
+        self._ensure_loaded()
+        indexes = self._indexes.get(service_id)
+        if indexes is not None:
+            return indexes
         
-        observability = service.get("observability", {})
-        splunk = observability.get("splunk", {})
-        return splunk.get("primary_indexes", [])
+        resolved_id = self._resolve_service_id(service_id)
+        if resolved_id is None:
+            return []
+        return self._indexes[resolved_id]
+    
+    def find_service_by_index(self, index: str) -> Optional[str]:
+        """Find the service id that owns a Splunk index (case-insensitive)."""
+        self._ensure_loaded()
+        return self._index_to_service.get(index.lower())
     
     def get_upstream_dependencies(self, service_id: str) -> List[Dict[str, Any]]:
         """Get upstream dependencies for a service."""
+        self._ensure_loaded()
         service = self.find_service(service_id)
         if not service:
             return []
@@ -86,51 +198,43 @@ class ServiceCatalog:
     
     def get_downstream_dependencies(self, service_id: str) -> List[str]:
         """Get downstream dependencies (services that depend on this service)."""
-        downstream = []
-        for service_id_check, service_data in self.services.items():
-            dependencies = service_data.get("dependencies", {})
-            upstream = dependencies.get("upstream", [])
-            for dep in upstream:
-                if isinstance(dep, dict):
-                    dep_service = dep.get("service")
-                else:
-                    dep_service = dep
-                
-                if dep_service == service_id:
-                    downstream.append(service_id_check)
-        
-        return downstream
+        self._ensure_loaded()
+        return list(self._downstream.get(service_id, ()))
     
     def get_dependency_chain(self, service_id: str, direction: str = "upstream") -> List[str]:
         """Get full dependency chain (upstream or downstream) for a service."""
+        self._ensure_loaded()
+        cache_key = (service_id, direction)
+        cached = self._chain_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
         visited: Set[str] = set()
         chain: List[str] = []
         
-        def traverse(current_service: str):
+        # Iterative depth-first walk (same order as a recursive pre-order traversal)
+        pending = deque([service_id])
+        while pending:
+            current_service = pending.pop()
             if current_service in visited:
-                return
+                continue
             visited.add(current_service)
             chain.append(current_service)
             
             if direction == "upstream":
-                deps = self.get_upstream_dependencies(current_service)
-                for dep in deps:
-                    if isinstance(dep, dict):
-                        dep_service = dep.get("service")
-                    else:
-                        dep_service = dep
-                    if dep_service:
-                        traverse(dep_service)
+                # Upstream names are resolved like get_upstream_dependencies does
+                resolved_id = self._resolve_service_id(current_service)
+                deps = self._upstream_ids.get(resolved_id, ()) if resolved_id is not None else ()
             else:  # downstream
-                deps = self.get_downstream_dependencies(current_service)
-                for dep_service in deps:
-                    traverse(dep_service)
+                deps = self._downstream.get(current_service, ())
+            pending.extend(reversed(deps))
         
-        traverse(service_id)
-        return chain
+        self._chain_cache[cache_key] = chain
+        return list(chain)
     
     def get_failure_modes(self, service_id: str, upstream_service: str) -> List[str]:
         """Get failure modes for a dependency relationship."""
+        self._ensure_loaded()
         service = self.find_service(service_id)
         if not service:
             return []
@@ -148,6 +252,7 @@ class ServiceCatalog:
     
     def get_criticality(self, service_id: str) -> Optional[str]:
         """Get criticality level of a service."""
+        self._ensure_loaded()
         service = self.find_service(service_id)
         if not service:
             return None
@@ -155,17 +260,20 @@ class ServiceCatalog:
     
     def get_service_info(self, service_id: str) -> Dict[str, Any]:
         """Get comprehensive service information."""
+        self._ensure_loaded()
         service = self.find_service(service_id)
         if not service:
             return {}
         
+        # Rebuilt per call from the load-time indexes and the chain cache; every
+        # list is a fresh copy so callers can't mutate catalog state
         return {
             "service_id": service.get("service_id"),
             "domain": service.get("domain"),
             "tier": service.get("tier"),
             "criticality": service.get("criticality"),
-            "splunk_indexes": self.get_splunk_indexes(service_id),
-            "upstream_dependencies": self.get_upstream_dependencies(service_id),
+            "splunk_indexes": list(self.get_splunk_indexes(service_id)),
+            "upstream_dependencies": list(self.get_upstream_dependencies(service_id)),
             "downstream_dependencies": self.get_downstream_dependencies(service_id),
             "dependency_chain_upstream": self.get_dependency_chain(service_id, "upstream"),
             "dependency_chain_downstream": self.get_dependency_chain(service_id, "downstream")
@@ -1,28 +1,25 @@
 """Shared utility functions."""
-from datetime import datetime, timedelta
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Tuple
 
-def parse_time_window(time_window: Optional[str]) -> Tuple[datetime, datetime]:
-    """Parse time window string into start and end datetime."""
-    if time_window is None:
-        # Default to last 24 hours
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=24)
-        return start_time, end_time
-    
-    # Handle relative time windows like "1h", "24h", "7d"
-    if time_window.endswith('h'):
-        hours = int(time_window[:-1])
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=hours)
-    elif time_window.endswith('d'):
-        days = int(time_window[:-1])
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(days=days)
-    else:
+# Relative time windows like "30m", "1h", "24h", "7d"
+_TW_RE = re.compile(r"^(\d+)([hdm])$")
+_UNIT = {"h": "hours", "d": "days", "m": "minutes"}
+_DEFAULT_WINDOW = timedelta(hours=24)
+
+@lru_cache(maxsize=64)
+def _time_window_delta(time_window: Optional[str]) -> timedelta:
+    """Convert a relative time window string to a timedelta (24 hours if unknown)."""
+    match = _TW_RE.match(time_window or "")
+    if match is None:
         # Default to 24 hours if format is unknown
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=24)
-    
-    return start_time, end_time
+        return _DEFAULT_WINDOW
+    return timedelta(**{_UNIT[match.group(2)]: int(match.group(1))})
 
+def parse_time_window(time_window: Optional[str]) -> Tuple[datetime, datetime]:
+    """Parse time window string into start and end datetime (naive UTC)."""
+    # Naive UTC to stay comparable with stored incident timestamps
+    end_time = datetime.now(timezone.utc).replace(tzinfo=None)
+    return end_time - _time_window_delta(time_window), end_time
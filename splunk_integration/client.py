@@ -1,13 +1,21 @@
 """Splunk REST API client."""
 import splunklib.client as client
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import structlog
 import asyncio
-import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import urllib3
-import json
+from cachetools import TTLCache
 
-from splunk_integration.config import SplunkConfig
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from shared import jsonlib
+from splunk_integration.config import SplunkConfig, get_splunk_config
 from splunk_integration.models import SplunkSearchResult
 
 # Disable SSL warnings if verification is disabled
@@ -15,13 +23,89 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = structlog.get_logger()
 
+# Searches whose results change from one call to the next are never cached
+_UNCACHEABLE_SEARCH_RE = re.compile(r"\b(?:earliest|latest)\s*=\s*\"?rt|\|\s*dedup\s+_time\b", re.IGNORECASE)
+
 class SplunkClient:
     """Splunk REST API client."""
     
-    def __init__(self):
-        self.config = SplunkConfig()
+    # Dedicated pool for blocking splunklib calls, shared by all clients so they
+    # don't compete with every other run_in_executor(None, ...) user in the process
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    # Short-lived oneshot result cache shared by all clients. Results are stored as
+    # immutable serialized JSON, so callers always get a private copy on a hit.
+    # Written from executor threads and read on the event loop, so guarded by a thread lock.
+    _search_cache: Optional[TTLCache] = None
+    _search_cache_lock = threading.Lock()
+    
+    def __init__(self, config: Optional[SplunkConfig] = None):
+        self.config = config or get_splunk_config()
         self.service = None
         self._connected = False
+        # Config is fixed for the client's lifetime, so build connect kwargs once.
+        # SSL verification goes through splunklib's own `verify` flag rather than
+        # process-wide environment variables.
+        self._connect_kwargs = {
+            "host": self.config.host,
+            "port": self.config.port,
+            "username": self.config.username,
+            "password": self.config.password,
+            "scheme": self.config.scheme,
+            "verify": self.config.verify,
+        }
+    
+    @classmethod
+    def _get_executor(cls, max_workers: int) -> ThreadPoolExecutor:
+        """Get (creating on first use) the shared Splunk REST thread pool."""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=max_workers or 16,
+                        thread_name_prefix="splunk-rest"
+                    )
+        return cls._executor
+    
+    @classmethod
+    def shutdown_executor(cls):
+        """Shut down the shared Splunk REST thread pool (call on application shutdown)."""
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False)
+                cls._executor = None
+    
+    def _search_cache_key(self, query: str, output_mode: str, count: int, kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """Build the search cache key, or None if this search must not be cached.
+        
+        The cache is shared by all clients, so the key is scoped to the Splunk
+        endpoint and account; unconfigured clients never use it.
+        """
+        if not self.config.is_configured():
+            return None
+        if self.config.search_cache_ttl <= 0 or _UNCACHEABLE_SEARCH_RE.search(query):
+            return None
+        for name in ("earliest_time", "latest_time"):
+            if str(kwargs.get(name, "")).startswith("rt"):
+                return None
+        try:
+            key = (
+                self.config.host, self.config.port, self.config.username,
+                query, output_mode, count, frozenset(kwargs.items())
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _get_search_cache(self) -> TTLCache:
+        """Get (creating on first use) the shared search result cache."""
+        if SplunkClient._search_cache is None:
+            SplunkClient._search_cache = TTLCache(
+                maxsize=self.config.search_cache_size,
+                ttl=self.config.search_cache_ttl
+            )
+        return SplunkClient._search_cache
     
     def _ensure_connected(self):
         """Ensure connection to Splunk is established (lazy connection)."""
@@ -42,31 +126,11 @@ class SplunkClient:
                        scheme=self.config.scheme,
                        verify_ssl=self.config.verify)
             
-            # Prepare connection kwargs
-            connect_kwargs = {
-                "host": self.config.host,
-                "port": self.config.port,
-                "username": self.config.username,
-                "password": self.config.password,
-                "scheme": self.config.scheme,
-            }
-            
-            # Handle SSL verification
             if not self.config.verify:
-                # Disable SSL verification for self-signed certificates
-                connect_kwargs["verify"] = False
-                # Also set environment variable for underlying HTTP library
-                # This helps with libraries that don't respect the verify parameter
-                os.environ['PYTHONHTTPSVERIFY'] = '0'
                 logger.warning("SSL verification disabled - using self-signed certificates", 
                              host=self.config.host)
-            else:
-                connect_kwargs["verify"] = True
-                # Ensure SSL verification is enabled if verify=True
-                if 'PYTHONHTTPSVERIFY' in os.environ:
-                    del os.environ['PYTHONHTTPSVERIFY']
             
-            self.service = client.connect(**connect_kwargs)
+            self.service = client.connect(**self._connect_kwargs)
             self._connected = True
             logger.info("Successfully connected to Splunk", host=self.config.host, port=self.config.port)
         except ConnectionRefusedError as e:
@@ -93,6 +157,41 @@ class SplunkClient:
             )
             raise
     
+    @staticmethod
+    def _parse_row(row: bytes) -> Dict[str, Any]:
+        """Parse one response row as JSON, wrapping anything else as _raw."""
+        try:
+            result = jsonlib.loads(row)
+        except ValueError:  # JSON decode errors of every backend, and UnicodeDecodeError
+            # If not JSON, treat as raw string
+            return {"_raw": row.decode('utf-8', errors='ignore')}
+        if isinstance(result, dict):
+            return result
+        # Fallback: wrap in dict
+        return {"_raw": str(result)}
+    
+    @classmethod
+    def _parse_document(cls, raw_bytes: bytes) -> List[Dict[str, Any]]:
+        """Parse a single JSON response document into result rows."""
+        document = cls._parse_row(raw_bytes)
+        rows = document.get("results")
+        if not isinstance(rows, list):
+            return [document]
+        return [row if isinstance(row, dict) else {"_raw": str(row)} for row in rows]
+    
+    @staticmethod
+    def _build_search_result(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the search response dict, taking fields from the first result."""
+        fields = []
+        if results and isinstance(results[0], dict):
+            fields = list(results[0].keys())
+        
+        return {
+            "results": results,
+            "total_count": len(results),
+            "fields": fields
+        }
+    
     async def search(
         self,
         query: str,
@@ -101,6 +200,16 @@ class SplunkClient:
         **kwargs
     ) -> Dict[str, Any]:
         """Execute a Splunk search query."""
+        # Serve repeated identical searches from the short-lived cache
+        cache_key = self._search_cache_key(query, output_mode, count, kwargs)
+        if cache_key is not None:
+            with self._search_cache_lock:
+                cached = self._get_search_cache().get(cache_key)
+            if cached is not None:
+                result = jsonlib.loads(cached)
+                logger.info("Splunk search served from cache", query=query[:100], results_count=result["total_count"])
+                return result
+        
         # Try to ensure connection, but handle failures gracefully
         try:
             self._ensure_connected()
@@ -131,39 +240,33 @@ class SplunkClient:
         def _search_sync():
             try:
                 job = self.service.jobs.oneshot(query, output_mode=output_mode, count=count, **kwargs)
-                results = []
-                for result in job:
-                    # Handle both dict and bytes responses
-                    if isinstance(result, bytes):
-                        # If result is bytes, try to parse as JSON
-                        try:
-                            result = json.loads(result.decode('utf-8'))
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            # If not JSON, treat as raw string
-                            result = {"_raw": result.decode('utf-8', errors='ignore')}
-                    elif isinstance(result, str):
-                        # If result is string, try to parse as JSON
-                        try:
-                            result = json.loads(result)
-                        except json.JSONDecodeError:
-                            result = {"_raw": result}
-                    # result should now be a dict
-                    if isinstance(result, dict):
-                        results.append(result)
+                if output_mode == "json" and ijson is not None:
+                    # Stream rows out of the {"results": [...]} document one at a time
+                    # instead of materializing the whole response body first
+                    results = [
+                        result if isinstance(result, dict) else {"_raw": str(result)}
+                        for result in ijson.items(job, "results.item", use_float=True)
+                    ]
+                else:
+                    raw_bytes = job.read().strip()
+                    if raw_bytes[:1] == b"{" and b"\n{" not in raw_bytes:
+                        # Single JSON document: parse once, unwrapping the {"results": [...]} envelope
+                        results = self._parse_document(raw_bytes)
                     else:
-                        # Fallback: wrap in dict
-                        results.append({"_raw": str(result)})
+                        # NDJSON (one object per line) or non-JSON rows: parse line by line
+                        results = [self._parse_row(line) for line in raw_bytes.splitlines() if line.strip()]
                 
-                # Extract fields from first result if available
-                fields = []
-                if results and isinstance(results[0], dict):
-                    fields = list(results[0].keys())
-                
-                return {
-                    "results": results,
-                    "total_count": len(results),
-                    "fields": fields
-                }
+                result = self._build_search_result(results)
+                if cache_key is not None:
+                    try:
+                        cached = jsonlib.dumps(result)
+                    except (TypeError, ValueError):
+                        # Rows that aren't JSON-serializable are simply not cached
+                        cached = None
+                    if cached is not None:
+                        with self._search_cache_lock:
+                            self._get_search_cache()[cache_key] = cached
+                return result
             except Exception as e:
                 # Reset connection on error
                 self._connected = False
@@ -171,8 +274,8 @@ class SplunkClient:
                 raise
         
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, _search_sync)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._get_executor(self.config.max_workers), _search_sync)
             logger.info("Splunk search completed", query=query[:100], results_count=result["total_count"])
             return result
         except Exception as e:
@@ -201,11 +304,10 @@ class SplunkClient:
                 raise
         
         try:
-            loop = asyncio.get_event_loop()
-            job_id = await loop.run_in_executor(None, _create_job_sync)
+            loop = asyncio.get_running_loop()
+            job_id = await loop.run_in_executor(self._get_executor(self.config.max_workers), _create_job_sync)
             logger.info("Created Splunk job", job_id=job_id)
             return job_id
         except Exception as e:
             logger.error("Failed to create Splunk job", error=str(e), query=query[:100])
             raise
-
@@ -1,8 +1,27 @@
 """Splunk configuration."""
-from pydantic_settings import BaseSettings
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
-class SplunkConfig(BaseSettings):
+from dotenv import dotenv_values
+
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSY = frozenset({"0", "false", "f", "no", "n", "off"})
+
+def _env_bool(name: str, value: Optional[str], default: bool) -> bool:
+    """Parse a boolean environment value, rejecting anything pydantic would have."""
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    if normalized in _TRUTHY:
+        return True
+    if normalized in _FALSY:
+        return False
+    raise ValueError(f"{name} must be a boolean (true/false, yes/no, on/off, 1/0), got {value!r}")
+
+@dataclass(slots=True, frozen=True)
+class SplunkConfig:
     """Splunk configuration."""
     host: Optional[str] = None
     port: int = 8089
@@ -10,12 +29,39 @@ class SplunkConfig(BaseSettings):
     password: Optional[str] = None
     scheme: str = "https"
     verify: bool = False
-    
-    class Config:
-        env_file = ".env"
-        env_prefix = "SPLUNK_"
-    
+    max_workers: int = 16  # threads for blocking splunklib REST calls
+    search_cache_ttl: int = 30  # seconds to reuse identical oneshot results; 0 disables
+    search_cache_size: int = 256
+
+    @classmethod
+    def from_env(cls) -> "SplunkConfig":
+        """Build the configuration from SPLUNK_* environment variables (and .env)."""
+        # Read .env without exporting it into os.environ; existing environment
+        # variables take precedence over .env, as before. Names are matched
+        # case-insensitively, like pydantic-settings' default.
+        env = {
+            name.upper(): value
+            for source in (dotenv_values(".env"), os.environ)
+            for name, value in source.items()
+        }
+        g = env.get
+        return cls(
+            host=g("SPLUNK_HOST"),
+            port=int(g("SPLUNK_PORT", "8089")),
+            username=g("SPLUNK_USERNAME"),
+            password=g("SPLUNK_PASSWORD"),
+            scheme=g("SPLUNK_SCHEME", "https"),
+            verify=_env_bool("SPLUNK_VERIFY", g("SPLUNK_VERIFY"), False),
+            max_workers=int(g("SPLUNK_MAX_WORKERS", "16")),
+            search_cache_ttl=int(g("SPLUNK_SEARCH_CACHE_TTL", "30")),
+            search_cache_size=int(g("SPLUNK_SEARCH_CACHE_SIZE", "256")),
+        )
+
     def is_configured(self) -> bool:
         """Check if Splunk is properly configured."""
         return all([self.host, self.username, self.password])
 
+@lru_cache(maxsize=1)
+def get_splunk_config() -> SplunkConfig:
+    """Get the process-wide Splunk configuration (environment/.env read once)."""
+    return SplunkConfig.from_env()